@@ -71,6 +71,78 @@ app.post("/api/chat", async (req, res, next) => {
   }
 });
 
+// Proxy streaming chat requests (server-sent events) without buffering,
+// so tokens reach the client as soon as the Python service emits them
+app.post("/api/chat/stream", async (req, res, next) => {
+  try {
+    const { conversation_id, user_message } = req.body || {};
+
+    if (!conversation_id || !user_message) {
+      return res.status(400).json({
+        error: "conversation_id and user_message are required"
+      });
+    }
+
+    const upstream = await axios.post(
+      `${PYTHON_SERVICE_URL}/chat/stream`,
+      { conversation_id, user_message },
+      { responseType: "stream" }
+    );
+
+    res.status(upstream.status);
+    res.set({
+      "Content-Type": "text/event-stream",
+      "Cache-Control": "no-cache",
+      Connection: "keep-alive",
+      "X-Accel-Buffering": "no"
+    });
+    res.flushHeaders();
+
+    // Stop generating upstream if the client goes away mid-stream
+    res.on("close", () => upstream.data.destroy());
+    // Headers are already sent, so an upstream failure can only end the stream
+    upstream.data.on("error", (streamErr) => {
+      console.error(
+        JSON.stringify({
+          level: "error",
+          msg: "Upstream stream error in API gateway",
+          error: streamErr.message,
+          stack: streamErr.stack
+        })
+      );
+      res.end();
+    });
+    upstream.data.pipe(res);
+  } catch (err) {
+    if (err.response) {
+      // The upstream body is a stream here; read it so errors such as the
+      // Python service's 503 when overloaded reach the client unchanged
+      let body = { error: "Upstream service error" };
+      try {
+        const chunks = [];
+        for await (const chunk of err.response.data) {
+          chunks.push(chunk);
+        }
+        body = JSON.parse(Buffer.concat(chunks).toString("utf8"));
+      } catch (readErr) {
+        // Not JSON (or unreadable); keep the generic error body
+      }
+      forwardRetryAfter(err.response, res);
+      return res.status(err.response.status || 500).json(body);
+    }
+    next(err);
+  }
+});
+
+// Pass the Python service's Retry-After (sent with 503 when overloaded)
+// through to the client
+function forwardRetryAfter(upstreamResponse, res) {
+  const retryAfter = upstreamResponse.headers?.["retry-after"];
+  if (retryAfter) {
+    res.set("Retry-After", retryAfter);
+  }
+}
+
 // Proxy conversation state inspection
 app.get("/api/conversations/:id", async (req, res, next) => {
   try {
@@ -97,6 +169,7 @@ app.use((err, req, res, next) => {
 
   if (err.response) {
     // Error came from downstream Python service
+    forwardRetryAfter(err.response, res);
     return res
       .status(err.response.status || 500)
       .json(err.response.data || { error: "Upstream service error" });
@@ -26,41 +26,56 @@ const App = () => {
     latestController.current = new AbortController();
 
     try {
-      const res = await axios.post(
-        "/api/chat",
-        {
+      const res = await fetch("/api/chat/stream", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
           conversation_id: conversationId,
           user_message: text
-        },
-        { signal: latestController.current.signal }
-      );
-
-      const { response_text } = res.data;
-
-      // Simulate streaming by gradually revealing the response
-      await simulateStreaming(response_text, (partial) => {
-        setMessages((prev) => {
-          const withoutTempAssistant = prev.filter(
-            (m) => m._tempStream !== true
-          );
-          return [
-            ...withoutTempAssistant,
-            { role: "assistant", content: partial, _tempStream: true }
-          ];
-        });
+        }),
+        signal: latestController.current.signal
+      });
+      if (!res.ok) {
+        throw new Error(`Chat request failed with status ${res.status}`);
+      }
+
+      // Reveal the response as the server streams it
+      let partial = "";
+      let responseText = null;
+      await readEventStream(res, (event, data) => {
+        if (event === "delta") {
+          partial += data.text;
+          setIsTyping(false);
+          setMessages((prev) => {
+            const withoutTempAssistant = prev.filter(
+              (m) => m._tempStream !== true
+            );
+            return [
+              ...withoutTempAssistant,
+              { role: "assistant", content: partial, _tempStream: true }
+            ];
+          });
+        } else if (event === "result") {
+          responseText = data.response_text;
+        } else if (event === "error") {
+          throw new Error(data.detail);
+        }
       });
+      if (responseText === null) {
+        throw new Error("Chat stream ended without a result");
+      }
 
       // Finalize assistant message
       setMessages((prev) => {
         const withoutTempAssistant = prev.filter((m) => m._tempStream !== true);
-        return [...withoutTempAssistant, { role: "assistant", content: response_text }];
+        return [...withoutTempAssistant, { role: "assistant", content: responseText }];
       });
 
       await refreshContext();
     } catch (err) {
       console.error("Error sending message", err);
       setMessages((prev) => [
-        ...prev,
+        ...prev.filter((m) => m._tempStream !== true),
         {
           role: "assistant",
           content: "Sorry, something went wrong while talking to the server."
@@ -71,15 +86,28 @@ const App = () => {
     }
   };
 
-  const simulateStreaming = async (fullText, onChunk) => {
-    const tokens = fullText.split(" ");
-    let partial = "";
-    for (const token of tokens) {
-      partial = partial ? `${partial} ${token}` : token;
-      onChunk(partial);
-      // Small delay to give a realistic typing effect
+  // Parse a server-sent event stream, calling onEvent(event, data) per event
+  const readEventStream = async (res, onEvent) => {
+    const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = "";
+    for (;;) {
       // eslint-disable-next-line no-await-in-loop
-      await new Promise((resolve) => setTimeout(resolve, 40));
+      const { value, done } = await reader.read();
+      if (done) return;
+      buffer += value;
+      let boundary = buffer.indexOf("\n\n");
+      while (boundary !== -1) {
+        const raw = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        let event = "message";
+        let data = "";
+        for (const line of raw.split("\n")) {
+          if (line.startsWith("event: ")) event = line.slice(7);
+          else if (line.startsWith("data: ")) data += line.slice(6);
+        }
+        onEvent(event, JSON.parse(data));
+        boundary = buffer.indexOf("\n\n");
+      }
     }
   };
 
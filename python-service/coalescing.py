@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+import orjson
+
+T = TypeVar("T")
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Return `value` itself if hashable, else a canonical JSON encoding of it.
+    """
+
+    try:
+        hash(value)
+    except TypeError:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str)
+    return value
+
+
+def coalesce(
+    fn: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """
+    Single-flight decorator for coroutine functions and methods.
+
+    Concurrent calls with equal arguments share one in-flight execution
+    instead of each issuing their own backend request. The shared call is
+    shielded, so one caller being cancelled does not cancel it for the rest.
+    """
+
+    in_flight: Dict[Hashable, asyncio.Future[T]] = {}
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (
+            tuple(_freeze(arg) for arg in args),
+            tuple((name, _freeze(value)) for name, value in sorted(kwargs.items())),
+        )
+        future = in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn(*args, **kwargs))
+            in_flight[key] = future
+            future.add_done_callback(lambda _: in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    return wrapper
@@ -1,24 +1,45 @@
 from __future__ import annotations
 
 import time
+from collections import OrderedDict, deque
+from itertools import islice
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Deque, Dict, List, Optional, Tuple, TypedDict
+
+import orjson
 
 from .config import get_settings
 
+# Backoff between summary attempts after failures: 5s, 10s, 20s, ... 5 min
+_SUMMARY_RETRY_BASE_SECONDS = 5.0
+_SUMMARY_RETRY_MAX_SECONDS = 300.0
+
 
 class Message(TypedDict):
     role: str  # "user" | "assistant" | "system"
     content: str
 
 
-class ConversationState(TypedDict, total=False):
+@dataclass(slots=True)
+class ConversationState:
     conversation_id: str
     created_at: float
     updated_at: float
-    intent: str
-    slots: Dict[str, Any]
-    history: List[Message]
+    intent: str = ""
+    slots: Dict[str, Any] = field(default_factory=dict)
+    history: Deque[Message] = field(default_factory=deque)
+    # Rolling summary of turns that have left the prompt window
+    summary: str = ""
+    # Turns past the prompt window not yet folded into `summary`
+    dropped: List[Message] = field(default_factory=list)
+    # Turns removed from the head of `dropped` so far (summarized or trimmed)
+    dropped_offset: int = 0
+    # Summary pass bookkeeping: one at a time, backed off after failures
+    summarizing: bool = False
+    summary_failures: int = 0
+    summary_retry_at: float = 0.0
+    # Cached result of ContextManager.get_summary
+    context_summary: Optional[str] = None
 
 
 @dataclass
@@ -27,30 +48,70 @@ class ContextManager:
     Simple in-memory context store for multi-turn conversations.
 
     In production, this would be backed by Redis or another durable store.
-    The API is designed to make that swap trivial.
+    The API is designed to make that swap trivial. States are held as live
+    objects, so a turn costs no encoding at all here; a durable backend
+    should keep history as an append-only list (e.g. RPUSH + LTRIM) rather
+    than rewriting one growing blob per turn, and use a compact binary
+    encoding for the remaining fields.
+
+    Conversations are kept in least-recently-updated order so that
+    expiry only ever needs to look at the head of the store.
     """
 
-    _store: Dict[str, ConversationState] = field(default_factory=dict)
+    _store: OrderedDict[str, ConversationState] = field(default_factory=OrderedDict)
+    _last_sweep: float = 0.0
+    _ttl: int = field(init=False)
+    _max_turns: int = field(init=False)
+    _window: int = field(init=False)
+    _max_dropped: int = field(init=False)
+    _summary_batch: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        settings = get_settings()
+        self._ttl = settings.context_ttl_seconds
+        self._max_turns = settings.max_history_turns
+        # Strictly smaller than the deque, so every turn leaves the prompt
+        # window (and is queued for summarizing) before the deque evicts it.
+        self._window = max(
+            min(settings.response_history_window, self._max_turns - 1), 0
+        )
+        # Unsummarized turns are sent verbatim, so bound them such that the
+        # prompt never carries more than `max_history_turns` messages.
+        self._max_dropped = max(self._max_turns - self._window, 1)
+        self._summary_batch = min(settings.history_summary_batch, self._max_dropped)
 
     def _now(self) -> float:
         return time.time()
 
     def get_or_create_conversation(self, conversation_id: str) -> ConversationState:
-        if conversation_id in self._store:
-            state = self._store[conversation_id]
-        else:
+        # Sweep first, so an expired conversation is replaced by a fresh
+        # state rather than returned after being popped from the store.
+        self._expire_old()
+        state = self._store.get(conversation_id)
+        if state is None:
+            now = self._now()
             state = ConversationState(
                 conversation_id=conversation_id,
-                created_at=self._now(),
-                updated_at=self._now(),
-                intent="",
-                slots={},
-                history=[],
+                created_at=now,
+                updated_at=now,
+                history=deque(maxlen=self._max_turns),
             )
             self._store[conversation_id] = state
-        self._expire_old()
         return state
 
+    def load_and_append(
+        self,
+        conversation_id: str,
+        new_messages: List[Message],
+    ) -> Tuple[ConversationState, str]:
+        """
+        Load a conversation, append `new_messages` and return the state
+        together with its context summary, in a single store access.
+        """
+
+        state = self.update_conversation(conversation_id, new_messages=new_messages)
+        return state, self._render_summary(state)
+
     def update_conversation(
         self,
         conversation_id: str,
@@ -62,49 +123,138 @@ class ContextManager:
         state = self.get_or_create_conversation(conversation_id)
 
         if intent is not None:
-            state["intent"] = intent
+            state.intent = intent
+            state.context_summary = None
 
         if slots is not None:
-            merged_slots = dict(state.get("slots", {}))
-            merged_slots.update(slots)
-            state["slots"] = merged_slots
+            # Build a new map rather than updating in place: callers may
+            # hold on to the previous one (e.g. WorkflowResult.slots).
+            state.slots = {**state.slots, **slots}
+            state.context_summary = None
 
         if new_messages:
-            history = state.get("history", [])
-            history.extend(new_messages)
+            # Turns sliding out of the prompt window are kept aside so they
+            # can be folded into the rolling summary.
+            history = state.history
+            dropped = state.dropped
+            window = self._window
+            for message in new_messages:
+                history.append(message)
+                if len(history) > window:
+                    dropped.append(history[-window - 1])
+            # If summarizing keeps failing, forget the oldest turns rather
+            # than letting the prompt grow without bound.
+            excess = len(dropped) - self._max_dropped
+            if excess > 0:
+                del dropped[:excess]
+                state.dropped_offset += excess
 
-            # Truncate history to configured maximum
-            max_turns = get_settings().max_history_turns
-            if len(history) > max_turns:
-                history = history[-max_turns:]
-            state["history"] = history
-
-        state["updated_at"] = self._now()
+        state.updated_at = self._now()
+        self._store.move_to_end(conversation_id)
         return state
 
+    def begin_summary(
+        self, state: ConversationState
+    ) -> Optional[Tuple[List[Message], int]]:
+        """
+        Start a summary pass if one is due: a full batch of turns has left
+        the prompt window, no pass is running and no failure backoff is in
+        effect. Returns the turns to fold and the position they end at, to
+        hand back to `finish_summary`; None if no pass should run.
+
+        The turns stay on the state until a summary covering them is stored,
+        so a failed pass loses nothing.
+        """
+
+        dropped = state.dropped
+        if (
+            state.summarizing
+            or len(dropped) < self._summary_batch
+            or self._now() < state.summary_retry_at
+        ):
+            return None
+        state.summarizing = True
+        return list(dropped), state.dropped_offset + len(dropped)
+
+    def get_compact_history(self, state: ConversationState) -> List[Message]:
+        """
+        History to send verbatim alongside the rolling summary: turns not
+        yet summarized, followed by the most recent prompt window.
+        """
+
+        history = state.history
+        recent = list(islice(history, max(len(history) - self._window, 0), None))
+        return state.dropped + recent if state.dropped else recent
+
+    def finish_summary(
+        self,
+        state: ConversationState,
+        summary: Optional[str],
+        folded_until: int,
+    ) -> None:
+        """
+        Record the outcome of a pass started with `begin_summary`.
+
+        On success, store the summary and remove the turns it covers (any
+        already trimmed meanwhile are accounted for). On failure (`summary`
+        is None), keep the turns and back off before the next attempt.
+        """
+
+        state.summarizing = False
+        if summary is None:
+            state.summary_failures += 1
+            state.summary_retry_at = self._now() + min(
+                _SUMMARY_RETRY_BASE_SECONDS * 2 ** (state.summary_failures - 1),
+                _SUMMARY_RETRY_MAX_SECONDS,
+            )
+            return
+
+        state.summary = summary
+        state.summary_failures = 0
+        state.summary_retry_at = 0.0
+        folded = folded_until - state.dropped_offset
+        if folded > 0:
+            del state.dropped[:folded]
+            state.dropped_offset += folded
+
     def get_summary(self, conversation_id: str) -> str:
         """
         Lightweight "summary" for prompt conditioning. We avoid a second
         LLM pass here and instead build a simple textual synopsis.
+
+        Slots are rendered as compact JSON, and the result is cached on the
+        state until the intent or slots change.
         """
 
-        state = self.get_or_create_conversation(conversation_id)
-        intent = state.get("intent", "")
-        slots = state.get("slots", {})
-        return f"Intent={intent}, Slots={slots}"
+        return self._render_summary(self.get_or_create_conversation(conversation_id))
+
+    @staticmethod
+    def _render_summary(state: ConversationState) -> str:
+        summary = state.context_summary
+        if summary is None:
+            intent = state.intent
+            slots = orjson.dumps(state.slots, default=str).decode("utf-8")
+            summary = f"Intent={intent}, Slots={slots}"
+            state.context_summary = summary
+        return summary
 
     def _expire_old(self) -> None:
         """
         Remove conversations that have exceeded the configured TTL.
+
+        Runs at most once per second; each sweep pops expired entries
+        from the head of the store and stops at the first live one.
         """
 
-        ttl = get_settings().context_ttl_seconds
-        cutoff = self._now() - ttl
-        to_delete = [
-            cid
-            for cid, state in self._store.items()
-            if state.get("updated_at", 0) < cutoff
-        ]
-        for cid in to_delete:
-            self._store.pop(cid, None)
+        now = self._now()
+        if now - self._last_sweep < 1.0:
+            return
+        self._last_sweep = now
+
+        cutoff = now - self._ttl
+        while self._store:
+            state = next(iter(self._store.values()))
+            if state.updated_at >= cutoff:
+                break
+            self._store.popitem(last=False)
 
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy import text
+from sqlalchemy import String, bindparam, text
 
+from .coalescing import coalesce
 from .config import get_settings
 from .logging_utils import log_with_context
 
 logger = logging.getLogger(__name__)
 
+_GET_ORDER_STMT = text(
+    "SELECT order_id, user_id, status, created_at "
+    "FROM orders WHERE order_id = :order_id"
+).bindparams(bindparam("order_id", type_=String))
+
 
-@dataclass
 class DBService:
     """
     Mediates all access to the relational database.
@@ -22,36 +26,41 @@ class DBService:
     engine calls into this service with strongly-typed parameters.
     """
 
-    session_factory: async_sessionmaker[AsyncSession]
+    __slots__ = ("session_factory",)
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.session_factory = session_factory
 
     @classmethod
     def from_settings(cls) -> "DBService":
         settings = get_settings()
         # For simplicity we assume the DSN uses an async-capable driver.
-        engine = create_async_engine(settings.sql_dsn, echo=False, future=True)
+        # The engine's pool keeps connections open across turns; recycling
+        # guards against server-side idle timeouts without a per-checkout ping.
+        engine = create_async_engine(
+            settings.sql_dsn,
+            echo=False,
+            future=True,
+            pool_size=settings.sql_pool_size,
+            max_overflow=settings.sql_max_overflow,
+            pool_recycle=1800,
+        )
         factory = async_sessionmaker(engine, expire_on_commit=False)
         return cls(session_factory=factory)
 
+    @coalesce
     async def get_order_by_id(self, order_id: str) -> Optional[Dict[str, Any]]:
         """
         Fetch an order by its business identifier.
         """
 
         async with self.session_factory() as session:
-            query = text(
-                "SELECT order_id, user_id, status, created_at "
-                "FROM orders WHERE order_id = :order_id"
-            )
             log_with_context(
                 logger,
                 logging.INFO,
                 "Executing order lookup",
                 order_id=order_id,
             )
-            result = await session.execute(query, {"order_id": order_id})
-            row = result.m.fetchone() if hasattr(result, "m") else result.fetchone()
-            if not row:
-                return None
-            mapping = dict(row._mapping)  # type: ignore[attr-defined]
-            return mapping
-
+            result = await session.execute(_GET_ORDER_STMT, {"order_id": order_id})
+            row = result.mappings().first()
+            return dict(row) if row else None
@@ -1,12 +1,51 @@
 from __future__ import annotations
 
+import logging
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from .llm_client import LLMClient, IntentPassResult
+from .llm_client import LLMClient
+from .logging_utils import log_with_context
+
+logger = logging.getLogger(__name__)
+
+# Order identifiers look like "id-857591726814891". Bare numbers are left
+# to the LLM: they are as likely to be zip codes or phone numbers.
+_ORDER_ID_RE = re.compile(r"\b(id-\d{4,})\b", re.IGNORECASE)
+_BARE_NUMBER_RE = re.compile(r"\b\d{6,}\b")
+_ORDER_RE = re.compile(
+    r"\b(order(s|ed|ing)?|package|parcel|shipment)\b", re.IGNORECASE
+)
+_ORDER_STATUS_RE = re.compile(r"\b(status|where|track(ing)?)\b", re.IGNORECASE)
+_REFUND_RE = re.compile(r"\b(refunds?|returns?|money back)\b", re.IGNORECASE)
+_DELIVERY_RE = re.compile(
+    r"\b(deliver(y|ed)?|shipping|arrive|how long)\b", re.IGNORECASE
+)
+# A question or request; keywords alone ("thanks for the refund info!")
+# are not enough to skip the LLM.
+_REQUEST_CUE_RE = re.compile(
+    r"\?"
+    r"|^\s*(what|when|where|how|why|which|can|could|would|will|is|are|do|does|did)\b"
+    r"|\b(please|tell me|show me|check|track|need|want|explain)\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class IntentResult:
+    """
+    Outcome of PASS 1: the classified intent and any extracted slot values.
+
+    `missing_slots` is advisory; the workflow recomputes missing slots from
+    the canonical schema in SlotManager.
+    """
+
+    intent: str
+    extracted_entities: Dict[str, Any]
+    missing_slots: Tuple[str, ...] = ()
 
 
-@dataclass
 class IntentEngine:
     """
     High-level wrapper around the LLM-based intent detection pass.
@@ -15,19 +54,85 @@ class IntentEngine:
     domain-friendly interface the rest of the system can depend on.
     """
 
-    llm_client: LLMClient
+    __slots__ = ("llm_client",)
+
+    def __init__(self, llm_client: LLMClient) -> None:
+        self.llm_client = llm_client
+
+    def fast_classify(self, user_message: str) -> Optional[IntentResult]:
+        """
+        Cheap keyword/regex classifier tried before PASS 1.
+
+        Returns a result only when the message is a question or request
+        (or carries an order id) and exactly one supported intent matches
+        unambiguously; anything else (including chitchat) returns None and
+        should go through the LLM.
+        """
+
+        order_id_match = _ORDER_ID_RE.search(user_message)
+        if order_id_match is None and (
+            _BARE_NUMBER_RE.search(user_message)
+            or not _REQUEST_CUE_RE.search(user_message)
+        ):
+            return None
+        mentions_order = _ORDER_RE.search(user_message) is not None
+
+        matches: List[str] = []
+        if order_id_match or (
+            mentions_order and _ORDER_STATUS_RE.search(user_message)
+        ):
+            matches.append("get_order_status")
+        if _REFUND_RE.search(user_message):
+            matches.append("ask_refund_policy")
+        if (
+            not mentions_order
+            and not order_id_match
+            and _DELIVERY_RE.search(user_message)
+        ):
+            matches.append("ask_delivery_time")
+
+        if len(matches) != 1:
+            return None
+
+        intent = matches[0]
+        extracted_entities: Dict[str, Any] = {}
+        missing_slots: Tuple[str, ...] = ()
+        if intent == "get_order_status":
+            if order_id_match:
+                extracted_entities["order_id"] = order_id_match.group(1)
+            else:
+                missing_slots = ("order_id",)
+
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Fast-path intent match",
+            intent=intent,
+            extracted_entities=extracted_entities,
+        )
+
+        return IntentResult(
+            intent=intent,
+            extracted_entities=extracted_entities,
+            missing_slots=missing_slots,
+        )
 
     async def detect_intent_and_slots(
         self,
         user_message: str,
         context_summary: str | None = None,
-    ) -> IntentPassResult:
+    ) -> IntentResult:
         """
         Run PASS 1 of the reasoning pipeline.
         """
 
-        return await self.llm_client.run_intent_pass(
+        result = await self.llm_client.run_intent_pass(
             user_message=user_message,
             context_summary=context_summary,
         )
+        return IntentResult(
+            intent=result["intent"],
+            extracted_entities=result["extracted_entities"],
+            missing_slots=tuple(result["missing_slots"]),
+        )
 
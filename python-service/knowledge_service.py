@@ -1,45 +1,86 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
+from .coalescing import coalesce
 from .config import get_settings
 from .logging_utils import log_with_context
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class KnowledgeService:
     """
     Encapsulates all access to the MongoDB-backed knowledge base.
+
+    Policy documents change on the order of days, so all three collections
+    are fetched together and cached in-process for `cache_ttl_seconds`.
     """
 
-    client: AsyncIOMotorClient
-    db: AsyncIOMotorDatabase
+    __slots__ = ("client", "db", "cache_ttl_seconds", "_cache")
+
+    def __init__(
+        self,
+        client: AsyncIOMotorClient,
+        db: AsyncIOMotorDatabase,
+        cache_ttl_seconds: float = 600.0,
+    ) -> None:
+        self.client = client
+        self.db = db
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._cache: Tuple[float, Dict[str, List[Dict[str, Any]]]] | None = None
 
     @classmethod
     def from_settings(cls) -> "KnowledgeService":
         settings = get_settings()
         client = AsyncIOMotorClient(settings.mongo_dsn)
         db = client[settings.mongo_db_name]
-        return cls(client=client, db=db)
+        return cls(
+            client=client,
+            db=db,
+            cache_ttl_seconds=settings.knowledge_cache_ttl_seconds,
+        )
+
+    @coalesce
+    async def get_all_policies(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch delivery, refund and shipping documents concurrently.
+
+        Results are served from the in-process cache while it is fresh, and
+        concurrent cache misses share a single fetch.
+        """
+
+        if self._cache is not None:
+            fetched_at, policies = self._cache
+            if time.monotonic() - fetched_at < self.cache_ttl_seconds:
+                return policies
+
+        log_with_context(logger, logging.INFO, "Fetching knowledge base policies")
+        delivery, refund, shipping = await asyncio.gather(
+            self._fetch_collection("delivery_time_policy"),
+            self._fetch_collection("refund_policy"),
+            self._fetch_collection("shipping_guidelines"),
+        )
+        policies = {"delivery": delivery, "refund": refund, "shipping": shipping}
+        self._cache = (time.monotonic(), policies)
+        return policies
 
     async def get_delivery_policies(self) -> List[Dict[str, Any]]:
-        log_with_context(logger, logging.INFO, "Fetching delivery time policies")
-        cursor = self.db["delivery_time_policy"].find({})
-        return [doc async for doc in cursor]
+        return (await self.get_all_policies())["delivery"]
 
     async def get_refund_policies(self) -> List[Dict[str, Any]]:
-        log_with_context(logger, logging.INFO, "Fetching refund policies")
-        cursor = self.db["refund_policy"].find({})
-        return [doc async for doc in cursor]
+        return (await self.get_all_policies())["refund"]
 
     async def get_shipping_guidelines(self) -> List[Dict[str, Any]]:
-        log_with_context(logger, logging.INFO, "Fetching shipping guidelines")
-        cursor = self.db["shipping_guidelines"].find({})
-        return [doc async for doc in cursor]
+        return (await self.get_all_policies())["shipping"]
+
+    async def _fetch_collection(self, collection: str) -> List[Dict[str, Any]]:
+        # Drop ObjectIds so the documents are plain JSON-serializable dicts
+        cursor = self.db[collection].find({}, projection={"_id": 0})
+        return await cursor.to_list(length=1000)
 
@@ -1,18 +1,151 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, TypedDict
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Final, List, Literal, Tuple, TypedDict
 
+import httpx
+import orjson
 from openai import AsyncOpenAI
 
+from .coalescing import coalesce
 from .config import get_settings
 from .logging_utils import log_with_context
 
 logger = logging.getLogger(__name__)
 
+# One connection pool for every LLMClient in the process, so keep-alive
+# connections (and their TCP/TLS setup) are shared rather than per instance.
+# Created on first use, and again after `close_shared_http_client`.
+_shared_http: httpx.AsyncClient | None = None
+
+# Follow-up questions depend only on (intent, missing slots), so a small
+# LRU of generated questions avoids an LLM round-trip for repeat cases.
+_FOLLOWUP_CACHE_SIZE: Final[int] = 128
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+INTENT_SYSTEM_PROMPT: Final[str] = (
+    "You are an intent classification and slot-extraction engine for an "
+    "e-commerce assistant called HelloBot.\n\n"
+    "You MUST respond with STRICT JSON only, with no explanations, no prose, "
+    "and no markdown code fences. The JSON object MUST have exactly these keys:\n"
+    "  - intent: string\n"
+    "  - missing_slots: array of strings\n"
+    "  - extracted_entities: object mapping slot names to values\n\n"
+    "Supported intents include (but are not limited to):\n"
+    "  - get_order_status: customer asks about status of an order\n"
+    "  - ask_delivery_time: customer asks how long delivery will take\n"
+    "  - ask_refund_policy: customer asks about refunds/returns\n"
+    "If none of these fit, use 'chitchat'.\n\n"
+    "For get_order_status, the primary slot is 'order_id'. "
+    "If the user did not provide it, include it in missing_slots.\n\n"
+    "IMPORTANT:\n"
+    "- If you are unsure, prefer 'chitchat'.\n"
+    "- Do NOT wrap the JSON in ```json or any markdown.\n"
+)
+
+FOLLOWUP_SYSTEM_PROMPT: Final[str] = (
+    "You are a conversational assistant helping a user complete "
+    "a request for an e-commerce assistant called HelloBot.\n\n"
+    "Given the user's intent and which slots are missing, you must generate "
+    "ONE short, friendly follow-up question that asks for ALL missing slots.\n\n"
+    "Guidelines:\n"
+    "- Use simple, customer-friendly language.\n"
+    "- Do not mention 'slots' or technical concepts.\n"
+    "- Do not add JSON or any metadata; return only the question text.\n"
+)
+
+RESPONSE_SYSTEM_PROMPT: Final[str] = (
+    "You are HelloBot, a helpful customer support assistant for an "
+    "e-commerce platform.\n\n"
+    "You receive the conversation so far, ending with the user's latest "
+    "message, followed by a final JSON message with:\n"
+    "- intent: the classified intent of the user\n"
+    "- slots: structured values like order_id\n"
+    "- retrieved_data: records from the orders database (if any)\n"
+    "- knowledge_snippets: policy documents from the knowledge base (if any)\n\n"
+    "Your job is to generate a concise, friendly response that:\n"
+    "- Answers the user's implied question or request.\n"
+    "- Uses retrieved_data for concrete facts like order status.\n"
+    "- Uses knowledge_snippets for policies like delivery times or refunds.\n"
+    "- Avoids exposing internal schema names or raw JSON.\n\n"
+    "Do NOT include JSON in your reply. Respond as natural language prose only."
+)
+
+SUMMARY_SYSTEM_PROMPT: Final[str] = (
+    "You maintain a running summary of a customer support conversation "
+    "for an e-commerce assistant called HelloBot.\n\n"
+    "You receive the previous summary (possibly empty) and the oldest "
+    "messages that are being removed from the conversation window. "
+    "Return an updated summary that keeps every fact the assistant may "
+    "still need (order numbers, requests, answers already given).\n\n"
+    "Guidelines:\n"
+    "- At most a few short sentences.\n"
+    "- Plain prose only; no JSON, lists, or markdown.\n"
+)
+
+_INTENT_SYSTEM_MESSAGE: Final[Dict[str, str]] = {
+    "role": "system",
+    "content": INTENT_SYSTEM_PROMPT,
+}
+_FOLLOWUP_SYSTEM_MESSAGE: Final[Dict[str, str]] = {
+    "role": "system",
+    "content": FOLLOWUP_SYSTEM_PROMPT,
+}
+_RESPONSE_SYSTEM_MESSAGE: Final[Dict[str, str]] = {
+    "role": "system",
+    "content": RESPONSE_SYSTEM_PROMPT,
+}
+_SUMMARY_SYSTEM_MESSAGE: Final[Dict[str, str]] = {
+    "role": "system",
+    "content": SUMMARY_SYSTEM_PROMPT,
+}
+
+
+def _encode_payload(payload: Dict[str, Any]) -> str:
+    """
+    Serialize a user payload for the provider.
+
+    Values orjson cannot encode natively (e.g. Mongo ObjectIds) fall back
+    to their string form.
+    """
+
+    return orjson.dumps(payload, default=str).decode("utf-8")
+
+
+def _get_shared_http() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP pool, (re)creating it if needed.
+    """
+
+    global _shared_http
+    if _shared_http is None or _shared_http.is_closed:
+        settings = get_settings()
+        _shared_http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.llm_max_keepalive_connections,
+                max_connections=settings.llm_max_connections,
+            ),
+        )
+    return _shared_http
+
+
+async def close_shared_http_client() -> None:
+    """
+    Close the process-wide HTTP pool used by all LLMClient instances.
+
+    Clients created afterwards (e.g. by the next app lifespan) get a new one.
+    """
+
+    global _shared_http
+    if _shared_http is not None:
+        await _shared_http.aclose()
+        _shared_http = None
+
 
 class IntentPassResult(TypedDict):
     intent: str
@@ -20,7 +153,6 @@ class IntentPassResult(TypedDict):
     extracted_entities: Dict[str, Any]
 
 
-@dataclass
 class LLMClient:
     """
     Thin wrapper around an OpenAI-compatible LLM provider.
@@ -30,23 +162,59 @@ class LLMClient:
     the workflow and intent engines.
     """
 
-    model: str
-    api_key: str | None
-    base_url: str | None
-
-    client: AsyncOpenAI = field(init=False, repr=False)
-
-    def __post_init__(self) -> None:
-        if not self.api_key:
+    __slots__ = (
+        "model",
+        "api_key",
+        "base_url",
+        "summary_model",
+        "_client_kwargs",
+        "_client",
+        "_followup_cache",
+    )
+
+    def __init__(
+        self,
+        model: str,
+        api_key: str | None,
+        base_url: str | None,
+        summary_model: str | None = None,
+        timeout: float = 30.0,
+        max_retries: int = 2,
+    ) -> None:
+        self.model = model
+        self.api_key = api_key
+        self.base_url = base_url
+        self.summary_model = summary_model
+
+        if not api_key:
             logger.warning(
                 "HELLOBOT_LLM_API_KEY is not set; LLM calls will fail at runtime."
             )
 
-        client_kwargs: Dict[str, Any] = {"api_key": self.api_key}
-        if self.base_url:
-            client_kwargs["base_url"] = self.base_url
+        client_kwargs: Dict[str, Any] = {
+            "api_key": api_key,
+            "timeout": httpx.Timeout(timeout, connect=5.0),
+            "max_retries": max_retries,
+        }
+        if base_url:
+            client_kwargs["base_url"] = base_url
+
+        # Built on first use: AsyncOpenAI refuses to construct without a key,
+        # and that must not stop the service (and its probes) from starting.
+        self._client_kwargs = client_kwargs
+        self._client: AsyncOpenAI | None = None
+        self._followup_cache: OrderedDict[Tuple[str, Tuple[str, ...]], str] = (
+            OrderedDict()
+        )
 
-        self.client = AsyncOpenAI(**client_kwargs)
+    @property
+    def client(self) -> AsyncOpenAI:
+        client = self._client
+        if client is None:
+            client = self._client = AsyncOpenAI(
+                http_client=_get_shared_http(), **self._client_kwargs
+            )
+        return client
 
     @classmethod
     def from_settings(cls) -> "LLMClient":
@@ -55,6 +223,25 @@ class LLMClient:
             model=settings.llm_model,
             api_key=settings.llm_api_key,
             base_url=str(settings.llm_base_url) if settings.llm_base_url else None,
+            summary_model=settings.llm_summary_model,
+            timeout=settings.llm_timeout_seconds,
+            max_retries=settings.llm_max_retries,
+        )
+
+    @classmethod
+    def intent_client_from_settings(cls) -> "LLMClient":
+        """
+        Client for PASS 1, backed by the smaller intent model.
+        """
+
+        settings = get_settings()
+        base_url = settings.llm_intent_base_url or settings.llm_base_url
+        return cls(
+            model=settings.llm_intent_model,
+            api_key=settings.llm_api_key,
+            base_url=str(base_url) if base_url else None,
+            timeout=settings.llm_timeout_seconds,
+            max_retries=settings.llm_max_retries,
         )
 
     async def run_intent_pass(
@@ -73,26 +260,6 @@ class LLMClient:
         }
         """
 
-        system_prompt = (
-            "You are an intent classification and slot-extraction engine for an "
-            "e-commerce assistant called HelloBot.\n\n"
-            "You MUST respond with STRICT JSON only, with no explanations, no prose, "
-            "and no markdown code fences. The JSON object MUST have exactly these keys:\n"
-            "  - intent: string\n"
-            "  - missing_slots: array of strings\n"
-            "  - extracted_entities: object mapping slot names to values\n\n"
-            "Supported intents include (but are not limited to):\n"
-            "  - get_order_status: customer asks about status of an order\n"
-            "  - ask_delivery_time: customer asks how long delivery will take\n"
-            "  - ask_refund_policy: customer asks about refunds/returns\n"
-            "If none of these fit, use 'chitchat'.\n\n"
-            "For get_order_status, the primary slot is 'order_id'. "
-            "If the user did not provide it, include it in missing_slots.\n\n"
-            "IMPORTANT:\n"
-            "- If you are unsure, prefer 'chitchat'.\n"
-            "- Do NOT wrap the JSON in ```json or any markdown.\n"
-        )
-
         user_payload: Dict[str, Any] = {
             "user_message": user_message,
         }
@@ -100,16 +267,17 @@ class LLMClient:
             user_payload["context_summary"] = context_summary
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            _INTENT_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": json.dumps(user_payload, ensure_ascii=False),
+                "content": _encode_payload(user_payload),
             },
         ]
 
         raw = await self._call_provider(messages=messages, mode="json")
 
-        parsed = self._parse_json_safely(raw)
+        # JSON mode guarantees fence-free output, so skip the sanitizer
+        parsed = self._parse_json_safely(raw, trust_json=True)
 
         intent = str(parsed.get("intent") or "chitchat")
         missing_slots_raw = parsed.get("missing_slots") or []
@@ -140,6 +308,7 @@ class LLMClient:
             extracted_entities=extracted_entities,
         )
 
+    @coalesce
     async def run_slot_followup_pass(
         self,
         intent: str,
@@ -147,21 +316,19 @@ class LLMClient:
     ) -> str:
         """
         PASS 2 — Ask a natural-language follow-up question to fill missing slots.
+
+        Questions are cached per (intent, missing slots); a cache hit skips
+        the provider call entirely.
         """
 
         if not missing_slots:
             return ""
 
-        system_prompt = (
-            "You are a conversational assistant helping a user complete "
-            "a request for an e-commerce assistant called HelloBot.\n\n"
-            "Given the user's intent and which slots are missing, you must generate "
-            "ONE short, friendly follow-up question that asks for ALL missing slots.\n\n"
-            "Guidelines:\n"
-            "- Use simple, customer-friendly language.\n"
-            "- Do not mention 'slots' or technical concepts.\n"
-            "- Do not add JSON or any metadata; return only the question text.\n"
-        )
+        cache_key = (intent, tuple(sorted(missing_slots)))
+        cached = self._followup_cache.get(cache_key)
+        if cached is not None:
+            self._followup_cache.move_to_end(cache_key)
+            return cached
 
         user_payload = {
             "intent": intent,
@@ -169,10 +336,10 @@ class LLMClient:
         }
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            _FOLLOWUP_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": json.dumps(user_payload, ensure_ascii=False),
+                "content": _encode_payload(user_payload),
             },
         ]
 
@@ -188,6 +355,11 @@ class LLMClient:
             followup=followup,
         )
 
+        if followup:
+            self._followup_cache[cache_key] = followup
+            if len(self._followup_cache) > _FOLLOWUP_CACHE_SIZE:
+                self._followup_cache.popitem(last=False)
+
         return followup
 
     async def run_response_pass(
@@ -197,100 +369,248 @@ class LLMClient:
         retrieved_data: Dict[str, Any] | None,
         knowledge_snippets: list[Dict[str, Any]] | None,
         conversation_history: list[Dict[str, Any]],
+        history_summary: str | None = None,
     ) -> str:
         """
         PASS 3 — Generate a polished, user-facing response from structured data.
+
+        `history_summary` carries a compressed account of turns that have
+        already been evicted from `conversation_history`.
         """
 
-        system_prompt = (
-            "You are HelloBot, a helpful customer support assistant for an "
-            "e-commerce platform.\n\n"
-            "You receive:\n"
-            "- intent: the classified intent of the user\n"
-            "- slots: structured values like order_id\n"
-            "- retrieved_data: records from the orders database (if any)\n"
-            "- knowledge_snippets: policy documents from the knowledge base (if any)\n"
-            "- conversation_history: prior messages in this conversation\n\n"
-            "Your job is to generate a concise, friendly response that:\n"
-            "- Answers the user's implied question or request.\n"
-            "- Uses retrieved_data for concrete facts like order status.\n"
-            "- Uses knowledge_snippets for policies like delivery times or refunds.\n"
-            "- Avoids exposing internal schema names or raw JSON.\n\n"
-            "Do NOT include JSON in your reply. Respond as natural language prose only."
+        messages = self._build_response_messages(
+            intent=intent,
+            slots=slots,
+            retrieved_data=retrieved_data,
+            knowledge_snippets=knowledge_snippets,
+            conversation_history=conversation_history,
+            history_summary=history_summary,
+        )
+
+        text = await self._call_provider(messages=messages, mode="text")
+        response = text.strip()
+
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Response pass completed",
+            intent=intent,
+            response_preview=response[:120],
         )
 
+        return response
+
+    async def run_response_pass_stream(
+        self,
+        intent: str,
+        slots: Dict[str, Any],
+        retrieved_data: Dict[str, Any] | None,
+        knowledge_snippets: list[Dict[str, Any]] | None,
+        conversation_history: list[Dict[str, Any]],
+        history_summary: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        PASS 3, streamed — yield response text chunks as the provider emits them.
+
+        Takes the same arguments as `run_response_pass`.
+        """
+
+        messages = self._build_response_messages(
+            intent=intent,
+            slots=slots,
+            retrieved_data=retrieved_data,
+            knowledge_snippets=knowledge_snippets,
+            conversation_history=conversation_history,
+            history_summary=history_summary,
+        )
+
+        length = 0
+        async for delta in self._stream_provider(messages=messages):
+            length += len(delta)
+            yield delta
+
+        log_with_context(
+            logger,
+            logging.INFO,
+            "Streamed response pass completed",
+            intent=intent,
+            length=length,
+        )
+
+    @staticmethod
+    def _build_response_messages(
+        *,
+        intent: str,
+        slots: Dict[str, Any],
+        retrieved_data: Dict[str, Any] | None,
+        knowledge_snippets: list[Dict[str, Any]] | None,
+        conversation_history: list[Dict[str, Any]],
+        history_summary: str | None,
+    ) -> List[Dict[str, str]]:
+        """
+        Build the PASS 3 prompt in a prefix-stable order:
+
+            [system][summary][history ... latest user message][turn data]
+
+        Everything before the per-turn data only ever grows by appending
+        between summary refreshes, so servers with prefix caching (e.g.
+        vLLM `--enable-prefix-caching`) can reuse it from turn to turn.
+        """
+
         user_payload = {
             "intent": intent,
             "slots": slots,
             "retrieved_data": retrieved_data,
             "knowledge_snippets": knowledge_snippets,
-            "conversation_history": conversation_history,
+        }
+
+        messages: List[Dict[str, str]] = [_RESPONSE_SYSTEM_MESSAGE]
+        if history_summary:
+            messages.append(
+                {
+                    "role": "system",
+                    "content": f"[Prior conversation summary]: {history_summary}",
+                }
+            )
+        messages.extend(conversation_history)
+        messages.append(
+            {
+                "role": "user",
+                "content": _encode_payload(user_payload),
+            }
+        )
+
+        return messages
+
+    async def run_summary_pass(
+        self,
+        previous_summary: str,
+        dropped_messages: list[Dict[str, Any]],
+    ) -> str:
+        """
+        Fold turns evicted from the history window into the rolling summary.
+
+        Uses the (cheaper) summary model with a small token budget, since
+        the output is only ever fed back into PASS 3 as context.
+        """
+
+        if not dropped_messages:
+            return previous_summary
+
+        user_payload = {
+            "previous_summary": previous_summary,
+            "dropped_messages": dropped_messages,
         }
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            _SUMMARY_SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": json.dumps(user_payload, ensure_ascii=False),
+                "content": _encode_payload(user_payload),
             },
         ]
 
-        text = await self._call_provider(messages=messages, mode="text")
-        response = text.strip()
+        text = await self._call_provider(
+            messages=messages,
+            mode="text",
+            model=self.summary_model,
+            max_tokens=256,
+        )
+        summary = text.strip()
 
         log_with_context(
             logger,
             logging.INFO,
-            "Response pass completed",
-            intent=intent,
-            response_preview=response[:120],
+            "Summary pass completed",
+            dropped=len(dropped_messages),
+            summary_length=len(summary),
         )
 
-        return response
+        return summary
 
     async def _call_provider(
         self,
         *,
         messages: List[Dict[str, str]],
         mode: Literal["json", "text"],
+        model: str | None = None,
+        max_tokens: int | None = None,
     ) -> str:
         """
         Call the underlying OpenAI-compatible provider.
 
         - For `mode='json'`, we request a JSON object via response_format.
         - For `mode='text'`, we allow free-form natural language.
+
+        `model` overrides the client's default model for this call only.
         """
 
-        log_with_context(
-            logger,
-            logging.DEBUG,
-            "Calling LLM provider",
-            mode=mode,
-            model=self.model,
-        )
+        model = model or self.model
+
+        if logger.isEnabledFor(logging.DEBUG):
+            log_with_context(
+                logger,
+                logging.DEBUG,
+                "Calling LLM provider",
+                mode=mode,
+                model=model,
+            )
 
         kwargs: Dict[str, Any] = {
-            "model": self.model,
+            "model": model,
             "messages": messages,
             "temperature": 0.1 if mode == "json" else 0.3,
         }
 
         if mode == "json":
             kwargs["response_format"] = {"type": "json_object"}
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
 
         completion = await self.client.chat.completions.create(**kwargs)
         choice = completion.choices[0]
         content = choice.message.content or ""
 
-        log_with_context(
-            logger,
-            logging.DEBUG,
-            "LLM raw response received",
-            length=len(content),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            log_with_context(
+                logger,
+                logging.DEBUG,
+                "LLM raw response received",
+                length=len(content),
+            )
 
         return content
 
+    async def _stream_provider(
+        self,
+        *,
+        messages: List[Dict[str, str]],
+    ) -> AsyncIterator[str]:
+        """
+        Stream a free-form text completion, yielding non-empty content deltas.
+        """
+
+        if logger.isEnabledFor(logging.DEBUG):
+            log_with_context(
+                logger,
+                logging.DEBUG,
+                "Streaming from LLM provider",
+                model=self.model,
+            )
+
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.3,
+            stream=True,
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
     @staticmethod
     def _strip_markdown_fences(text: str) -> str:
         """
@@ -307,27 +627,32 @@ class LLMClient:
                 inner = "\n".join(lines[1:-1])
                 return inner.strip()
 
-        fence_match = re.search(
-            r"```(?:json)?\s*(\{.*?\})\s*```",
-            stripped,
-            flags=re.DOTALL,
-        )
+        fence_match = _FENCE_RE.search(stripped)
         if fence_match:
             return fence_match.group(1).strip()
 
         return stripped
 
     @classmethod
-    def _parse_json_safely(cls, text: str) -> Dict[str, Any]:
+    def _parse_json_safely(cls, text: str, *, trust_json: bool = False) -> Dict[str, Any]:
         """
         Best-effort JSON parsing that tolerates markdown fencing and
         minor formatting deviations. Falls back to an empty dict on error.
+
+        With `trust_json=True` the text is parsed as-is first and only run
+        through the fence sanitizer if that fails.
         """
+        if trust_json:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+
         candidate = cls._strip_markdown_fences(text)
 
         try:
-            return json.loads(candidate)
-        except Exception as exc:  # noqa: BLE001
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError as exc:
             log_with_context(
                 logger,
                 logging.WARNING,
@@ -1,6 +1,6 @@
 import logging
 import sys
-from typing import Any, Dict
+from typing import Any
 
 
 def configure_logging() -> None:
@@ -28,13 +28,19 @@ def log_with_context(
     logger: logging.Logger,
     level: int,
     message: str,
-    **context: Dict[str, Any],
+    **context: Any,
 ) -> None:
     """
     Helper to emit log messages with structured context as a flat dict.
+
+    Returns early when `level` is disabled, and defers formatting of the
+    context to the logging machinery so `repr` only runs for emitted records.
     """
 
+    if not logger.isEnabledFor(level):
+        return
     if context:
-        message = f"{message} | context={context!r}"
-    logger.log(level, message)
+        logger.log(level, "%s | context=%r", message, context)
+    else:
+        logger.log(level, message)
 
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import orjson
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from .config import Settings, get_settings
@@ -12,15 +15,59 @@ from .context_manager import ContextManager
 from .db_service import DBService
 from .intent_engine import IntentEngine
 from .knowledge_service import KnowledgeService
-from .llm_client import LLMClient
+from .llm_client import LLMClient, close_shared_http_client
 from .logging_utils import configure_logging, log_with_context
 from .slot_manager import SlotManager
-from .workflow_engine import WorkflowEngine, WorkflowResult
+from .workflow_engine import TurnRejectedError, WorkflowEngine, WorkflowResult
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="HelloBot Orchestration Service", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Build the service singletons once at startup and release shared
+    resources on shutdown.
+    """
+
+    settings = get_settings()
+    context_manager = ContextManager()
+    llm_client = LLMClient.from_settings()
+    intent_llm_client = LLMClient.intent_client_from_settings()
+    db_service = DBService.from_settings()
+    knowledge_service = KnowledgeService.from_settings()
+    slot_manager = SlotManager()
+    intent_engine = IntentEngine(llm_client=intent_llm_client)
+
+    app.state.context_manager = context_manager
+    app.state.llm_client = llm_client
+    app.state.intent_llm_client = intent_llm_client
+    app.state.db_service = db_service
+    app.state.knowledge_service = knowledge_service
+    app.state.slot_manager = slot_manager
+    app.state.intent_engine = intent_engine
+    app.state.workflow_engine = WorkflowEngine(
+        context_manager=context_manager,
+        intent_engine=intent_engine,
+        slot_manager=slot_manager,
+        llm_client=llm_client,
+        db_service=db_service,
+        knowledge_service=knowledge_service,
+        max_inflight_turns=settings.max_inflight_turns,
+        turn_queue_timeout_seconds=settings.turn_queue_timeout_seconds,
+    )
+
+    yield
+
+    await close_shared_http_client()
+
+
+app = FastAPI(
+    title="HelloBot Orchestration Service",
+    version="1.0.0",
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -54,70 +101,51 @@ class ConversationStateResponse(BaseModel):
     history: List[Dict[str, Any]]
 
 
-# Dependency wiring
+# Dependency wiring: singletons are built once in `lifespan`
 def get_context_manager() -> ContextManager:
-    # Singleton-like in-process instance
-    if not hasattr(app.state, "context_manager"):
-        app.state.context_manager = ContextManager()
     return app.state.context_manager
 
 
-def get_llm_client(settings: Settings = Depends(get_settings)) -> LLMClient:
-    if not hasattr(app.state, "llm_client"):
-        app.state.llm_client = LLMClient.from_settings()
+def get_llm_client() -> LLMClient:
     return app.state.llm_client
 
 
-def get_db_service(settings: Settings = Depends(get_settings)) -> DBService:
-    if not hasattr(app.state, "db_service"):
-        app.state.db_service = DBService.from_settings()
+def get_db_service() -> DBService:
     return app.state.db_service
 
 
-def get_knowledge_service(settings: Settings = Depends(get_settings)) -> KnowledgeService:
-    if not hasattr(app.state, "knowledge_service"):
-        app.state.knowledge_service = KnowledgeService.from_settings()
+def get_knowledge_service() -> KnowledgeService:
     return app.state.knowledge_service
 
 
 def get_slot_manager() -> SlotManager:
-    if not hasattr(app.state, "slot_manager"):
-        app.state.slot_manager = SlotManager()
     return app.state.slot_manager
 
 
-def get_intent_engine(llm_client: LLMClient = Depends(get_llm_client)) -> IntentEngine:
-    if not hasattr(app.state, "intent_engine"):
-        app.state.intent_engine = IntentEngine(llm_client=llm_client)
+def get_intent_engine() -> IntentEngine:
     return app.state.intent_engine
 
 
-def get_workflow_engine(
-    context_manager: ContextManager = Depends(get_context_manager),
-    intent_engine: IntentEngine = Depends(get_intent_engine),
-    slot_manager: SlotManager = Depends(get_slot_manager),
-    llm_client: LLMClient = Depends(get_llm_client),
-    db_service: DBService = Depends(get_db_service),
-    knowledge_service: KnowledgeService = Depends(get_knowledge_service),
-) -> WorkflowEngine:
-    if not hasattr(app.state, "workflow_engine"):
-        app.state.workflow_engine = WorkflowEngine(
-            context_manager=context_manager,
-            intent_engine=intent_engine,
-            slot_manager=slot_manager,
-            llm_client=llm_client,
-            db_service=db_service,
-            knowledge_service=knowledge_service,
-        )
+def get_workflow_engine() -> WorkflowEngine:
     return app.state.workflow_engine
 
 
+def _chat_response_body(result: WorkflowResult) -> Dict[str, Any]:
+    return {
+        "conversation_id": result.conversation_id,
+        "intent": result.intent,
+        "slots": result.slots,
+        "response_text": result.response_text,
+        "awaiting_more_input": result.awaiting_more_input,
+    }
+
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(
     payload: ChatRequest,
     request: Request,
     workflow: WorkflowEngine = Depends(get_workflow_engine),
-) -> ChatResponse:
+) -> Dict[str, Any]:
     """
     Main conversational endpoint.
 
@@ -139,6 +167,8 @@ async def chat_endpoint(
             conversation_id=payload.conversation_id,
             user_message=payload.user_message,
         )
+    except TurnRejectedError as exc:
+        raise _overloaded(exc) from exc
     except Exception as exc:  # noqa: BLE001
         log_with_context(
             logger,
@@ -148,32 +178,109 @@ async def chat_endpoint(
         )
         raise HTTPException(status_code=500, detail="Internal server error") from exc
 
-    return ChatResponse(
-        conversation_id=result.conversation_id,
-        intent=result.intent,
-        slots=result.slots,
-        response_text=result.response_text,
-        awaiting_more_input=result.awaiting_more_input,
+    # Plain dict: FastAPI validates and serializes it straight through
+    # `response_model`, with no intermediate ChatResponse instance.
+    return _chat_response_body(result)
+
+
+def _overloaded(exc: TurnRejectedError) -> HTTPException:
+    """
+    Map a rejected turn to a 503 the client can retry.
+    """
+
+    log_with_context(logger, logging.WARNING, "Chat turn rejected", reason=str(exc))
+    return HTTPException(
+        status_code=503,
+        detail="Service is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+def _sse_turn_item(item: str | WorkflowResult) -> bytes:
+    if isinstance(item, WorkflowResult):
+        return _sse_event("result", _chat_response_body(item))
+    return _sse_event("delta", {"text": item})
+
+
+@app.post("/chat/stream")
+async def chat_stream_endpoint(
+    payload: ChatRequest,
+    request: Request,
+    workflow: WorkflowEngine = Depends(get_workflow_engine),
+) -> StreamingResponse:
+    """
+    Streaming variant of `/chat` using server-sent events.
+
+    Emits `delta` events (`{"text": ...}`) as the response is generated,
+    then a single `result` event carrying the same body as `/chat`.
+    """
+
+    log_with_context(
+        logger,
+        logging.INFO,
+        "Incoming streaming chat request",
+        path=str(request.url.path),
+        conversation_id=payload.conversation_id,
+    )
+
+    # Pull the first item before responding, so a rejected or failed turn
+    # still gets a proper status code rather than an in-band error.
+    turn = workflow.stream_turn(
+        conversation_id=payload.conversation_id,
+        user_message=payload.user_message,
     )
+    try:
+        first = await anext(turn)
+    except TurnRejectedError as exc:
+        raise _overloaded(exc) from exc
+    except Exception as exc:  # noqa: BLE001
+        log_with_context(
+            logger,
+            logging.ERROR,
+            "Unhandled error in streaming chat endpoint",
+            error=str(exc),
+        )
+        raise HTTPException(status_code=500, detail="Internal server error") from exc
+
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            yield _sse_turn_item(first)
+            async for item in turn:
+                yield _sse_turn_item(item)
+        except Exception as exc:  # noqa: BLE001
+            # Headers are already sent, so report the failure in-band.
+            log_with_context(
+                logger,
+                logging.ERROR,
+                "Unhandled error in streaming chat endpoint",
+                error=str(exc),
+            )
+            yield _sse_event("error", {"detail": "Internal server error"})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 
 @app.get("/conversations/{conversation_id}", response_model=ConversationStateResponse)
 async def get_conversation_state(
     conversation_id: str,
     context_manager: ContextManager = Depends(get_context_manager),
-) -> ConversationStateResponse:
+) -> Dict[str, Any]:
     """
     Read-only inspection endpoint for the current state of a conversation.
     This powers the "context/state inspection panel" in the UI.
     """
 
     state = context_manager.get_or_create_conversation(conversation_id)
-    return ConversationStateResponse(
-        conversation_id=conversation_id,
-        intent=state.get("intent", ""),
-        slots=state.get("slots", {}),
-        history=state.get("history", []),
-    )
+    return {
+        "conversation_id": conversation_id,
+        "intent": state.intent,
+        "slots": state.slots,
+        "history": list(state.history),
+    }
 
 
 @app.get("/healthz")
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of PASS 3 responses with per-entry expiry.
+
+    Entries are keyed by a digest of everything the response is grounded
+    on (intent, slots, retrieved data, knowledge snippets), so a hit means
+    the LLM would be asked to phrase exactly the same facts again.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        intent: str,
+        slots: Dict[str, Any],
+        retrieved_data: Optional[Dict[str, Any]],
+        knowledge_snippets: Optional[List[Dict[str, Any]]],
+    ) -> str:
+        payload = orjson.dumps(
+            {
+                "intent": intent,
+                "slots": slots,
+                "retrieved_data": retrieved_data,
+                "knowledge_snippets": knowledge_snippets,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: str, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import Dict, FrozenSet, Optional, Set, Tuple
+
+from .intent_engine import IntentResult
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Function words that carry no intent on their own; dropping them keeps
+# short paraphrases ("what is your refund policy" / "refund policy?") close.
+_STOPWORDS: FrozenSet[str] = frozenset(
+    {
+        "a", "an", "and", "are", "can", "could", "do", "does", "for", "hi",
+        "hello", "i", "is", "it", "me", "my", "of", "on", "please", "s",
+        "the", "to", "what", "whats", "you", "your",
+    }
+)
+
+# (term counts, vector norm)
+_Vector = Tuple[Counter[str], float]
+
+
+def _vectorize(text: str) -> Optional[_Vector]:
+    terms = Counter(
+        token
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in _STOPWORDS
+    )
+    if not terms:
+        return None
+    return terms, math.sqrt(sum(n * n for n in terms.values()))
+
+
+def _cosine(a: _Vector, b: _Vector) -> float:
+    (a_terms, a_norm), (b_terms, b_norm) = a, b
+    if len(a_terms) > len(b_terms):
+        a_terms, b_terms = b_terms, a_terms
+    dot = sum(n * b_terms[t] for t, n in a_terms.items() if t in b_terms)
+    return dot / (a_norm * b_norm)
+
+
+class SemanticIntentCache:
+    """
+    Nearest-neighbour cache of PASS 1 results for near-duplicate messages.
+
+    Messages are compared by cosine similarity of their bag-of-words
+    vectors, so a rephrasing of an already classified question skips the
+    intent LLM call. Only results that do not depend on message-specific
+    entities should be stored (see `WorkflowEngine`).
+
+    An inverted term index limits each lookup to entries sharing at least
+    one term with the message, keeping misses cheap enough to run inline
+    on the event loop.
+    """
+
+    __slots__ = ("threshold", "maxsize", "_entries", "_postings")
+
+    def __init__(self, threshold: float = 0.9, maxsize: int = 256) -> None:
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Tuple[_Vector, IntentResult]] = OrderedDict()
+        self._postings: Dict[str, Set[str]] = {}
+
+    def get(self, message: str) -> Optional[IntentResult]:
+        vector = _vectorize(message)
+        if vector is None:
+            return None
+        key = " ".join(sorted(vector[0].elements()))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        candidates: Set[str] = set()
+        for term in vector[0]:
+            postings = self._postings.get(term)
+            if postings:
+                candidates |= postings
+
+        best_key: Optional[str] = None
+        best_score = self.threshold
+        for candidate_key in candidates:
+            score = _cosine(vector, self._entries[candidate_key][0])
+            if score >= best_score:
+                best_key, best_score = candidate_key, score
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1]
+
+    def set(self, message: str, result: IntentResult) -> None:
+        vector = _vectorize(message)
+        if vector is None:
+            return
+        key = " ".join(sorted(vector[0].elements()))
+        if key not in self._entries:
+            for term in vector[0]:
+                self._postings.setdefault(term, set()).add(key)
+        self._entries[key] = (vector, result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            evicted_key, ((evicted_terms, _), _) = self._entries.popitem(last=False)
+            for term in evicted_terms:
+                postings = self._postings[term]
+                postings.discard(evicted_key)
+                if not postings:
+                    del self._postings[term]
@@ -1,7 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, FrozenSet, List
+
+_NO_SLOTS: FrozenSet[str] = frozenset()
+
+
+def _normalize_order_id(value: Any) -> str:
+    # Stored identifiers are lowercase ("id-857591726814891"), while users
+    # and the LLM may write "ID-..." or pad with whitespace.
+    return str(value).strip().lower()
+
+
+# Canonical form per slot, applied once as entities are merged
+_SLOT_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {
+    "order_id": _normalize_order_id,
+}
 
 
 @dataclass
@@ -18,9 +32,16 @@ class SlotManager:
             "ask_refund_policy": [],
         }
     )
+    _required: Dict[str, FrozenSet[str]] = field(init=False, repr=False)
 
-    def get_required_slots(self, intent: str) -> List[str]:
-        return self.required_slots_by_intent.get(intent, [])
+    def __post_init__(self) -> None:
+        self._required = {
+            intent: frozenset(required)
+            for intent, required in self.required_slots_by_intent.items()
+        }
+
+    def get_required_slots(self, intent: str) -> FrozenSet[str]:
+        return self._required.get(intent, _NO_SLOTS)
 
     def merge_slots(
         self,
@@ -30,21 +51,38 @@ class SlotManager:
         """
         Merge newly extracted entities into the existing slot map.
         New values override old ones for simplicity.
+
+        New values are normalized to their canonical form on the way in, so
+        every later read (and cache key) sees one spelling. Missing values
+        (None) are kept as-is and still count as missing.
         """
 
         merged = dict(existing_slots)
-        merged.update(new_entities)
+        for name, value in new_entities.items():
+            normalize = _SLOT_NORMALIZERS.get(name)
+            if normalize is not None and value is not None:
+                value = normalize(value)
+            merged[name] = value
         return merged
 
     def compute_missing_slots(
         self,
         intent: str,
         current_slots: Dict[str, Any],
-    ) -> List[str]:
+    ) -> FrozenSet[str]:
         """
-        Determine which required slots are still missing.
+        Determine which required slots are still missing (absent, or
+        present but empty).
         """
 
         required = self.get_required_slots(intent)
-        return [slot for slot in required if slot not in current_slots or current_slots[slot] in ("", None)]
+        if not required:
+            return required
+        missing = required.difference(current_slots)
+        empty = {
+            slot
+            for slot in required - missing
+            if current_slots[slot] in ("", None)
+        }
+        return missing | empty if empty else missing
 
@@ -1,17 +1,138 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from .context_manager import ContextManager
+from .context_manager import ContextManager, ConversationState, Message
 from .db_service import DBService
 from .intent_engine import IntentEngine
 from .knowledge_service import KnowledgeService
 from .llm_client import LLMClient
+from .logging_utils import log_with_context
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticIntentCache
 from .slot_manager import SlotManager
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# (retrieved order data, knowledge snippets) for a turn
+SideEffectResult = Tuple[Optional[Dict[str, Any]], Optional[List[Dict[str, Any]]]]
+SideEffectHandler = Callable[[Dict[str, Any]], Awaitable[SideEffectResult]]
+
+# Knowledge-base section (see KnowledgeService.get_all_policies) per intent
+_POLICY_KEY_BY_INTENT: Dict[str, str] = {
+    "ask_delivery_time": "delivery",
+    "ask_refund_policy": "refund",
+}
+
+# How long a PASS 3 response may be reused, by intent. Order status goes
+# stale quickly; policy answers only change with the knowledge base.
+# Intents not listed here (e.g. chitchat) depend on the raw user message
+# and are never cached.
+_RESPONSE_TTL_BY_INTENT: Dict[str, float] = {
+    "get_order_status": 30.0,
+    "ask_delivery_time": 600.0,
+    "ask_refund_policy": 600.0,
+}
+
+# Orders rarely change within a conversation, so repeat lookups of the
+# same order are served from memory for a short while.
+_ORDER_CACHE_TTL_SECONDS = 60.0
+_ORDER_CACHE_SIZE = 10_000
+
+
+async def _skip() -> None:
+    return None
+
+
+def _discard(task: asyncio.Task[Any]) -> None:
+    """
+    Cancel a task whose result is no longer needed, retrieving any
+    exception so it is not reported as unhandled.
+    """
+
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+class TurnRejectedError(RuntimeError):
+    """
+    Raised when a turn is not admitted: the engine is at capacity, or an
+    earlier turn of the same conversation did not finish in time.
+    """
+
+
+class _ConversationGate:
+    """
+    Serializes the turns of one conversation; dropped once unused.
+    """
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class _ResponseBroadcast:
+    """
+    A PASS 3 stream generated once and replayed to any number of turns.
+    """
+
+    __slots__ = ("chunks", "done", "error", "_changed")
+
+    def __init__(self) -> None:
+        self.chunks: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+
+    def publish(self, delta: str) -> None:
+        self.chunks.append(delta)
+        self._notify()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        self.done = True
+        self.error = error
+        self._notify()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        sent = 0
+        while True:
+            # Take the event before reading, so nothing published after
+            # this point can be missed.
+            changed = self._changed
+            while sent < len(self.chunks):
+                yield self.chunks[sent]
+                sent += 1
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await changed.wait()
+
+
+@dataclass(slots=True)
 class WorkflowResult:
     """
     Canonical result of a single conversational turn.
@@ -29,6 +150,12 @@ class WorkflowEngine:
     """
     Orchestrates the full 3-pass reasoning pipeline and all side-effecting
     operations (database queries, knowledge retrieval, etc.).
+
+    The CPU work done per turn (regex classification, orjson, cache-key
+    hashing, the bounded semantic cache scan) is microsecond-scale and
+    runs inline on the event loop; a thread hand-off would cost more than
+    it saves. Anything heavier added later (local tokenization or
+    embedding) belongs in `asyncio.to_thread` or a process pool.
     """
 
     context_manager: ContextManager
@@ -37,6 +164,36 @@ class WorkflowEngine:
     llm_client: LLMClient
     db_service: DBService
     knowledge_service: KnowledgeService
+    response_cache: ResponseCache = field(default_factory=ResponseCache)
+    intent_cache: SemanticIntentCache = field(default_factory=SemanticIntentCache)
+    max_inflight_turns: int = 64
+    turn_queue_timeout_seconds: float = 10.0
+    _handlers: Dict[str, SideEffectHandler] = field(init=False, repr=False)
+    _inflight: asyncio.Semaphore = field(init=False, repr=False)
+    _gates: Dict[str, _ConversationGate] = field(init=False, repr=False)
+    # order_id -> (expires_at, order row)
+    _order_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = field(
+        init=False, repr=False
+    )
+    # Response cache key -> PASS 3 stream being generated for it right now,
+    # so identical concurrent turns share one LLM call.
+    _responses_in_flight: Dict[str, _ResponseBroadcast] = field(
+        init=False, repr=False
+    )
+    # Strong references to fire-and-forget tasks (e.g. summary refreshes)
+    _background_tasks: Set[asyncio.Task[None]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._inflight = asyncio.Semaphore(self.max_inflight_turns)
+        self._gates = {}
+        self._order_cache = OrderedDict()
+        self._responses_in_flight = {}
+        self._background_tasks = set()
+
+        # Side-effect handler per intent; anything else gets `_h_default`
+        self._handlers = {"get_order_status": self._h_order_status}
+        for intent, policy_key in _POLICY_KEY_BY_INTENT.items():
+            self._handlers[intent] = partial(self._h_policy, policy_key)
 
     async def handle_turn(
         self,
@@ -47,110 +204,376 @@ class WorkflowEngine:
         Core orchestration entrypoint for a single user turn.
         """
 
-        # 1. Load and update context with the new user message
-        state = self.context_manager.get_or_create_conversation(conversation_id)
-        state = self.context_manager.update_conversation(
+        result: Optional[WorkflowResult] = None
+        async for item in self.stream_turn(conversation_id, user_message):
+            if isinstance(item, WorkflowResult):
+                result = item
+        assert result is not None
+        return result
+
+    async def stream_turn(
+        self,
+        conversation_id: str,
+        user_message: str,
+    ) -> AsyncIterator[str | WorkflowResult]:
+        """
+        Run a single user turn, yielding response text chunks as they are
+        generated and finally the `WorkflowResult` for the turn.
+
+        Raises `TurnRejectedError` before yielding anything if the turn is
+        not admitted (see `_admit`).
+        """
+
+        async with self._admit(conversation_id):
+            async for item in self._run_turn(conversation_id, user_message):
+                yield item
+
+    @asynccontextmanager
+    async def _admit(self, conversation_id: str) -> AsyncIterator[None]:
+        """
+        Admission control for a turn.
+
+        Turns of the same conversation run one at a time, so a single user
+        holds at most one slot and their history stays consistent; a turn
+        waits up to `turn_queue_timeout_seconds` for the previous one. Past
+        `max_inflight_turns` concurrent turns, new ones are rejected
+        immediately rather than queued behind the LLM backend.
+        """
+
+        gate = self._gates.get(conversation_id)
+        if gate is None:
+            gate = self._gates[conversation_id] = _ConversationGate()
+        gate.users += 1
+        try:
+            try:
+                async with asyncio.timeout(self.turn_queue_timeout_seconds):
+                    await gate.lock.acquire()
+            except TimeoutError:
+                raise TurnRejectedError(
+                    "Previous turn of this conversation is still running"
+                ) from None
+            try:
+                if self._inflight.locked():
+                    raise TurnRejectedError("Too many turns in flight")
+                async with self._inflight:
+                    yield
+            finally:
+                gate.lock.release()
+        finally:
+            gate.users -= 1
+            if not gate.users:
+                del self._gates[conversation_id]
+
+    async def _run_turn(
+        self,
+        conversation_id: str,
+        user_message: str,
+    ) -> AsyncIterator[str | WorkflowResult]:
+
+        # 1. Load context and append the new user message in one access;
+        # the state is then reused for the rest of the turn.
+        state, context_summary = self.context_manager.load_and_append(
             conversation_id,
             new_messages=[{"role": "user", "content": user_message}],
         )
 
-        context_summary = self.context_manager.get_summary(conversation_id)
+        # Fold turns that left the prompt window into the rolling summary in
+        # the background; the new summary is picked up by a later turn, and
+        # until then the turns are still sent verbatim.
+        self._schedule_summary_refresh(state)
 
-        # 2. PASS 1 — intent & initial slot extraction via LLM
-        intent_result = await self.intent_engine.detect_intent_and_slots(
-            user_message=user_message,
-            context_summary=context_summary,
+        # 2. PASS 1 — intent & initial slot extraction. Unambiguous messages
+        # and near-duplicates of earlier knowledge questions are classified
+        # locally; otherwise the LLM pass runs.
+        fast_result = self.intent_engine.fast_classify(
+            user_message
+        ) or self.intent_cache.get(user_message)
+
+        # While the LLM classifies, speculatively run the side effects for
+        # last turn's intent and slots; they are reused only on an exact match.
+        # Slot maps are replaced on update, never mutated, so no copy is needed.
+        speculative: Optional[asyncio.Task[SideEffectResult]] = None
+        speculative_key = (state.intent, state.slots)
+        if fast_result is None and state.intent and not (
+            self.slot_manager.compute_missing_slots(
+                intent=state.intent,
+                current_slots=state.slots,
+            )
+        ):
+            speculative = asyncio.create_task(
+                self._perform_side_effects(*speculative_key)
+            )
+
+        intent_lookup = (
+            self.intent_engine.detect_intent_and_slots(
+                user_message=user_message,
+                context_summary=context_summary,
+            )
+            if fast_result is None
+            else _skip()
         )
+        try:
+            llm_result = await intent_lookup
+        except BaseException:
+            if speculative is not None:
+                _discard(speculative)
+            raise
+        if fast_result is not None:
+            intent_result = fast_result
+        else:
+            intent_result = llm_result
+            # Knowledge answers don't depend on anything in the message
+            # beyond its intent, so paraphrases can reuse the classification.
+            if (
+                intent_result.intent in _POLICY_KEY_BY_INTENT
+                and not intent_result.extracted_entities
+            ):
+                self.intent_cache.set(user_message, intent_result)
+        intent = intent_result.intent
 
-        current_slots = state.get("slots", {})
+        current_slots = state.slots
         merged_slots = self.slot_manager.merge_slots(
-            current_slots=current_slots,
-            new_entities=intent_result["extracted_entities"],
+            existing_slots=current_slots,
+            new_entities=intent_result.extracted_entities,
         )
 
         # Re-compute missing slots based on canonical intent definition
         canonical_missing = self.slot_manager.compute_missing_slots(
-            intent=intent_result["intent"],
+            intent=intent,
             current_slots=merged_slots,
         )
 
         # 3. PASS 2 — if anything is missing, generate a follow-up prompt
         if canonical_missing:
+            if speculative is not None:
+                _discard(speculative)
             followup = await self.llm_client.run_slot_followup_pass(
-                intent=intent_result["intent"],
-                missing_slots=canonical_missing,
+                intent=intent,
+                missing_slots=sorted(canonical_missing),
             )
 
             # Persist context and respond without touching databases yet
             updated = self.context_manager.update_conversation(
                 conversation_id,
-                intent=intent_result["intent"],
+                intent=intent,
                 slots=merged_slots,
                 new_messages=[{"role": "assistant", "content": followup}],
             )
-            return WorkflowResult(
+            yield followup
+            yield WorkflowResult(
                 conversation_id=conversation_id,
-                intent=intent_result["intent"],
-                slots=updated.get("slots", {}),
+                intent=intent,
+                slots=updated.slots,
                 response_text=followup,
                 awaiting_more_input=True,
             )
+            return
 
         # 4. All required slots present: perform side effects (DB, knowledge)
-        retrieved_data, knowledge_snippets = await self._perform_side_effects(
-            intent=intent_result["intent"],
-            slots=merged_slots,
-        )
+        if speculative is not None and speculative_key == (intent, merged_slots):
+            retrieved_data, knowledge_snippets = await speculative
+        else:
+            if speculative is not None:
+                _discard(speculative)
+            retrieved_data, knowledge_snippets = await self._perform_side_effects(
+                intent=intent,
+                slots=merged_slots,
+            )
 
-        # 5. PASS 3 — response framing
-        history = self.context_manager.get_or_create_conversation(conversation_id).get(
-            "history", []
-        )
-        response_text = await self.llm_client.run_response_pass(
-            intent=intent_result["intent"],
-            slots=merged_slots,
-            retrieved_data=retrieved_data,
-            knowledge_snippets=knowledge_snippets,
-            conversation_history=history,
-        )
+        # 5. PASS 3 — response framing, reusing a cached response grounded
+        # on the same intent, slots and retrieved data when available
+        response_ttl = _RESPONSE_TTL_BY_INTENT.get(intent)
+        cache_key: Optional[str] = None
+        cached_response: Optional[str] = None
+        if response_ttl is not None:
+            cache_key = self.response_cache.make_key(
+                intent=intent,
+                slots=merged_slots,
+                retrieved_data=retrieved_data,
+                knowledge_snippets=knowledge_snippets,
+            )
+            cached_response = self.response_cache.get(cache_key)
+
+        if cached_response is not None:
+            response_text = cached_response
+            yield response_text
+        else:
+            # Read summary and history together, so a summary landing
+            # mid-turn can't drop the turns it covers from this prompt.
+            pass_kwargs: Dict[str, Any] = {
+                "intent": intent,
+                "slots": merged_slots,
+                "retrieved_data": retrieved_data,
+                "knowledge_snippets": knowledge_snippets,
+                "conversation_history": self.context_manager.get_compact_history(
+                    state
+                ),
+                "history_summary": state.summary,
+            }
+            if cache_key is not None and response_ttl is not None:
+                stream = self._shared_response_stream(
+                    cache_key, response_ttl, pass_kwargs
+                )
+            else:
+                stream = self.llm_client.run_response_pass_stream(**pass_kwargs)
+            chunks: List[str] = []
+            async for delta in stream:
+                chunks.append(delta)
+                yield delta
+            response_text = "".join(chunks).strip()
 
         updated = self.context_manager.update_conversation(
             conversation_id,
-            intent=intent_result["intent"],
+            intent=intent,
             slots=merged_slots,
             new_messages=[{"role": "assistant", "content": response_text}],
         )
 
-        return WorkflowResult(
+        yield WorkflowResult(
             conversation_id=conversation_id,
-            intent=intent_result["intent"],
-            slots=updated.get("slots", {}),
+            intent=intent,
+            slots=updated.slots,
             response_text=response_text,
             awaiting_more_input=False,
         )
 
+    def _shared_response_stream(
+        self,
+        cache_key: str,
+        ttl_seconds: float,
+        pass_kwargs: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        """
+        Subscribe to the PASS 3 stream for `cache_key`, starting it if no
+        identical turn is generating it already.
+
+        The provider stream is driven by its own task, so each subscriber
+        reads at its own pace: a slow client neither holds back the others
+        nor the generation, and late joiners get the text so far at once.
+        """
+
+        broadcast = self._responses_in_flight.get(cache_key)
+        if broadcast is None:
+            broadcast = self._responses_in_flight[cache_key] = _ResponseBroadcast()
+            task = asyncio.create_task(
+                self._produce_response(broadcast, cache_key, ttl_seconds, pass_kwargs)
+            )
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        return broadcast.subscribe()
+
+    async def _produce_response(
+        self,
+        broadcast: _ResponseBroadcast,
+        cache_key: str,
+        ttl_seconds: float,
+        pass_kwargs: Dict[str, Any],
+    ) -> None:
+        try:
+            async for delta in self.llm_client.run_response_pass_stream(**pass_kwargs):
+                broadcast.publish(delta)
+        except Exception as exc:  # noqa: BLE001
+            # Subscribers re-raise it; the task itself ends cleanly.
+            broadcast.close(exc)
+        except BaseException:
+            broadcast.close(RuntimeError("Response generation was cancelled"))
+            raise
+        else:
+            response_text = "".join(broadcast.chunks).strip()
+            if response_text:
+                self.response_cache.set(cache_key, response_text, ttl_seconds)
+            broadcast.close()
+        finally:
+            if self._responses_in_flight.get(cache_key) is broadcast:
+                del self._responses_in_flight[cache_key]
+
+    def _schedule_summary_refresh(self, state: ConversationState) -> None:
+        job = self.context_manager.begin_summary(state)
+        if job is None:
+            return
+        task = asyncio.create_task(self._refresh_history_summary(state, *job))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh_history_summary(
+        self,
+        state: ConversationState,
+        dropped: List[Message],
+        folded_until: int,
+    ) -> None:
+        """
+        Fold turns that left the prompt window into the rolling summary,
+        for a job started with `ContextManager.begin_summary`.
+
+        Summarizing is an optimization: if the pass fails, the turns stay
+        pending (and are still sent verbatim, up to a cap), the previous
+        summary is used and the next attempt is backed off, rather than
+        failing the turn.
+        """
+
+        new_summary: Optional[str] = None
+        try:
+            new_summary = await self.llm_client.run_summary_pass(
+                previous_summary=state.summary,
+                dropped_messages=dropped,
+            )
+        except Exception as exc:  # noqa: BLE001
+            log_with_context(
+                logger,
+                logging.WARNING,
+                "History summary pass failed; keeping previous summary",
+                conversation_id=state.conversation_id,
+                pending=len(dropped),
+                error=str(exc),
+            )
+        finally:
+            self.context_manager.finish_summary(state, new_summary, folded_until)
+
     async def _perform_side_effects(
         self,
         intent: str,
         slots: Dict[str, Any],
-    ) -> Tuple[Optional[Dict[str, Any]], Optional[List[Dict[str, Any]]]]:
+    ) -> SideEffectResult:
         """
         Perform any database or knowledge-base operations required
-        for the given intent.
+        for the given intent, dispatching to its registered handler.
+
+        A handler for an intent that needs several services should issue
+        its lookups concurrently (`asyncio.gather`).
         """
 
-        retrieved_data: Optional[Dict[str, Any]] = None
-        knowledge_snippets: Optional[List[Dict[str, Any]]] = None
+        return await self._handlers.get(intent, self._h_default)(slots)
 
-        if intent == "get_order_status":
-            order_id = str(slots.get("order_id"))
-            retrieved_data = await self.db_service.get_order_by_id(order_id)
+    async def _h_order_status(self, slots: Dict[str, Any]) -> SideEffectResult:
+        # Slots arrive normalized from SlotManager.merge_slots; a missing id
+        # means there is nothing to look up.
+        order_id = slots.get("order_id")
+        if not order_id:
+            return None, None
 
-        elif intent == "ask_delivery_time":
-            knowledge_snippets = await self.knowledge_service.get_delivery_policies()
+        now = time.monotonic()
+        cached = self._order_cache.get(order_id)
+        if cached is not None and cached[0] > now:
+            self._order_cache.move_to_end(order_id)
+            return cached[1], None
 
-        elif intent == "ask_refund_policy":
-            knowledge_snippets = await self.knowledge_service.get_refund_policies()
+        # Unknown orders are not cached, so a newly created one is found
+        # on the next attempt.
+        order = await self.db_service.get_order_by_id(order_id)
+        if order is not None:
+            self._order_cache[order_id] = (now + _ORDER_CACHE_TTL_SECONDS, order)
+            self._order_cache.move_to_end(order_id)
+            if len(self._order_cache) > _ORDER_CACHE_SIZE:
+                self._order_cache.popitem(last=False)
+        return order, None
 
-        return retrieved_data, knowledge_snippets
+    async def _h_policy(
+        self,
+        policy_key: str,
+        slots: Dict[str, Any],
+    ) -> SideEffectResult:
+        policies = await self.knowledge_service.get_all_policies()
+        return None, policies[policy_key]
 
+    async def _h_default(self, slots: Dict[str, Any]) -> SideEffectResult:
+        return None, None